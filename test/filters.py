@@ -239,6 +239,14 @@ def test_or_():
            term_tester)
 
 
+def test_nested_operands():
+    a, b, c = F.al('hal'), F.upadha('Yam'), F.samjna('dhatu')
+    assert ((a & b) & c).operands == [a, b, c]
+    assert (a & (b & c)).operands == [a, b, c]
+    assert ((a | b) | c).operands == [a, b, c]
+    assert ((a | b) & c).operands == [a | b, c]
+
+
 def test_not_():
     cases = [
         (['al'],
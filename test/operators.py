@@ -2,7 +2,8 @@ import pytest
 
 from vyakarana.derivations import State
 import vyakarana.operators as O
-from vyakarana.terms import Upadesha
+from vyakarana.sounds import Sounds
+from vyakarana.terms import Pratyaya, Upadesha
 
 
 # Constructors
@@ -123,6 +124,108 @@ def test_samprasarana():
     verify(cases, O.samprasarana)
 
 
+def test_tasya_adi():
+    cases = [
+        ('kf', 'Af'),
+        ('Bu', 'Au'),
+    ]
+    verify(cases, O.tasya('A', adi=True))
+    verify(cases, O.tasya(Upadesha('A'), adi=True))
+
+
+def test_tasya_str():
+    # 1.1.52
+    cases = [
+        ('ji', 'jA'),
+        ('kf', 'kA'),
+    ]
+    verify(cases, O.tasya('A'))
+
+    # 1.1.55
+    cases = [
+        ('ji', 'Bav'),
+        ('kf', 'Bav'),
+    ]
+    verify(cases, O.tasya('Bav'))
+
+
+def test_tasya_sounds():
+    # 1.1.50
+    cases = [
+        ('ni', 'ny'),
+        ('Bu', 'Bv'),
+        ('kf', 'kr'),
+    ]
+    verify(cases, O.tasya(Sounds('yaR')))
+
+
+def test_tasya_mit():
+    # 1.1.47
+    cases = [
+        ('vac', 'vamc'),
+        ('muc', 'mumc'),
+    ]
+    verify(cases, O.tasya(Upadesha('mu~m')))
+
+    state = State([Upadesha('a~').set_value('muc')])
+    assert 'mu~m' in O.tasya(Upadesha('mu~m')).apply(state, 0)[0].parts
+
+
+def test_tasya_kit_wit():
+    # 1.1.46
+    cases = [
+        ('ji', 'jit'),
+        ('kf', 'kft'),
+    ]
+    verify(cases, O.tasya(Upadesha('tu~k')))
+
+    cases = [
+        ('ji', 'nji'),
+        ('kf', 'nkf'),
+    ]
+    verify(cases, O.tasya(Upadesha('nu~w')))
+
+    state = State([Upadesha('a~').set_value('ji')])
+    assert 'tu~k' in O.tasya(Upadesha('tu~k')).apply(state, 0)[0].parts
+    assert 'nu~w' in O.tasya(Upadesha('nu~w')).apply(state, 0)[0].parts
+
+
+def test_tasya_Nit():
+    # 1.1.53
+    cases = [
+        ('Bu', 'Bana'),
+        ('kf', 'kana'),
+    ]
+    verify(cases, O.tasya(Upadesha('anaN')))
+
+
+def test_tasya_upadesha():
+    # 1.1.52
+    cases = [
+        ('ji', 'jA'),
+    ]
+    verify(cases, O.tasya(Upadesha('A')))
+
+    # 1.1.55
+    cases = [
+        ('ji', 'BU'),
+        ('kf', 'BU'),
+    ]
+    verify(cases, O.tasya(Upadesha('BU')))
+    verify([('ji', 'nA')], O.tasya(Pratyaya('SnA')))
+
+
+def test_tasya_Sit():
+    # A one-letter 'Sit' sthani is matched by 1.1.52 first.
+    verify([('ji', 'ja')], O.tasya(Pratyaya('Sa')))
+
+    # 'Sit' is read from the samjna, so a 'Sit' sthani with no
+    # letters still reaches 1.1.55.
+    verify([('ji', '')], O.tasya(Pratyaya('Sa').set_value('')))
+    with pytest.raises(NotImplementedError):
+        verify([('ji', '')], O.tasya(Upadesha('BU').set_value('')))
+
+
 def test_vrddhi():
     cases = [
         ('ji', 'jE'),
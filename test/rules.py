@@ -1,4 +1,7 @@
+import vyakarana.operators as O
+from vyakarana.derivations import State
 from vyakarana.rules import *
+from vyakarana.terms import Upadesha
 
 
 def test_init():
@@ -10,6 +13,44 @@ def test_init():
     assert not r.utsarga
 
 
+def test_init_apply():
+    r = Rule('name', list('filters'), 'operator')
+    assert r._apply == r._apply_mandatory
+
+    r = Rule('name', list('filters'), 'operator', optional=True)
+    assert r._apply == r._apply_optional
+
+    r = Rule('name', list('filters'), 'operator', modifier=Na)
+    assert r._apply == r._apply_na
+
+
+def test_apply():
+    window = [[], ['filter']]
+    state = State([Upadesha('a~').set_value('kram')])
+
+    # Mandatory rules return nothing if the state doesn't change.
+    r = Rule('name', window, O.dirgha)
+    done = State([Upadesha('a~').set_value('krAm')])
+    assert r.apply(done, 0) == []
+
+    [new] = r.apply(state, 0)
+    assert new[0].value == 'krAm'
+    assert r in new[0].ops
+
+    # Optional rules return both the declined and accepted states.
+    r = Rule('name', window, O.dirgha, optional=True)
+    declined, accepted = r.apply(state, 0)
+    assert declined[0].value == 'kram'
+    assert accepted[0].value == 'krAm'
+    assert declined.history == accepted.history == [(r, 0)]
+
+    # 'na' rules only mark the state.
+    r = Rule('name', window, O.dirgha, modifier=Na)
+    [new] = r.apply(state, 0)
+    assert new[0].value == 'kram'
+    assert new.history == [(r, 0)]
+
+
 def test_new_paribhasha():
     pass
 
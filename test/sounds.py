@@ -124,3 +124,10 @@ class TestSounds(object):
         s = Sounds(name)
         assert s.name == name
         assert s.values == set('aApPbBmi')
+
+    def test_memoized(self):
+        assert Sounds('hal') is Sounds('hal')
+        assert Pratyahara('iR') is Pratyahara('iR')
+        assert Pratyahara('iR') is not Pratyahara('iR', second_R=True)
+        assert Pratyahara('iR', second_R=True) is \
+            Pratyahara('iR', second_R=True)
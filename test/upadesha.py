@@ -123,6 +123,18 @@ def test_copy():
     assert u2.parts == 'parts2'
 
 
+def test_add_op_keeps_filter_cache():
+    u = Upadesha('Bu\\')
+    u._filter_cache['name'] = True
+
+    u2 = u.add_op('op')
+    assert u2.ops == set(['op'])
+    assert u2._filter_cache == {'name': True}
+
+    u3 = u.add_samjna('dhatu')
+    assert u3._filter_cache == {}
+
+
 @pytest.fixture
 def eq_upadeshas():
     u2 = Upadesha('a')
@@ -16,6 +16,11 @@ from ..terms import Upadesha
 
 f = F.auto
 
+ec = Sounds('ec')
+
+#: Undoes zatva for `sa_adesha` by mapping retroflex to dental.
+DENTAL_OF_RETROFLEX = {'w': 't', 'W': 'T', 'R': 'n'}
+
 #: 6.1.15
 VACI_SVAPI = f(*['va\ca~', 'Yizva\pa~'] + DP.dhatu_list('ya\\ja~^'))
 
@@ -40,9 +45,8 @@ def do_dvirvacana(state, i, locus=None):
 @O.DataOperator.no_params
 def sa_adesha(value):
     if value.startswith('z'):
-        converter = {'w': 't', 'W': 'T', 'R': 'n'}
         v = value[1]
-        value = 's' + converter.get(v, v) + value[2:]
+        value = 's' + DENTAL_OF_RETROFLEX.get(v, v) + value[2:]
     return value
 
 
@@ -56,7 +60,7 @@ def na_adesha(value):
 @F.TermFilter.no_params
 def ec_upadesha(term):
     clean = term.clean
-    return clean and clean[-1] in Sounds('ec')
+    return clean and clean[-1] in ec
 
 
 RULES = [
@@ -19,17 +19,20 @@ there's no harm in matching on an aṅga generally.
 """
 
 from .. import filters as F, operators as O
-from ..sounds import Sounds
+from ..sounds import Sounds, memoize
 from ..templates import *
 from ..terms import Upadesha as U
 
 f = F.auto
 
+ac = Sounds('ac')
+hal = Sounds('hal')
+nasal = Sounds('Yam')
+jhash = Sounds('Jaz')
+
 
 @O.DataOperator.no_params
 def shnam_lopa(value):
-    ac = Sounds('ac')
-    nasal = Sounds('Yam')
     letters = list(reversed(value))
     for i, L in enumerate(letters):
         if L in ac:
@@ -45,11 +48,12 @@ def bhrasjo_ram(value, **kw):
     return 'Barj'
 
 
+iyan = O.tasya(U('iya~N'))
+uvan = O.tasya(U('uva~N'))
+
+
 @O.Operator.no_params
 def iyan_uvan(state, index, locus):
-    iyan = O.tasya(U('iya~N'))
-    uvan = O.tasya(U('uva~N'))
-
     cur = state[index]
     if cur.antya in 'iI':
         return iyan.apply(state, index, locus)
@@ -77,26 +81,35 @@ def allopa(value):
     return ''.join(reversed(letters))
 
 
+@memoize
+def ekahalmadhya_anadeshadi(abhyasa_adi, anga_value):
+    """Decide 6.4.120 from the abhyasa's first sound and the anga.
+
+    The decision depends on nothing else, and the same pairs recur
+    across derivations, so the result is memoized.
+    """
+    if len(anga_value) != 3:
+        return False
+
+    a, b, c = anga_value
+    # Anga has the pattern CVC, where C is a consonant and V
+    # is a vowel.
+    eka_hal_madhya = a in hal and b == 'a' and c in hal
+    # Abhyasa and anga have the same initial letter. I'm not
+    # sure how to account for 8.4.54 in the normal way, so as
+    # a hack, I check for the consonants that 8.4.54 would
+    # modify.
+    _8_4_54 = a not in jhash
+    anadeshadi = abhyasa_adi == a and _8_4_54
+
+    return eka_hal_madhya and anadeshadi
+
+
 @F.Filter.no_params
 def at_ekahalmadhya_anadeshadi(state, index):
-    try:
-        abhyasa = state[index - 1]
-        anga = state[index]
-        a, b, c = anga.value
-        hal = Sounds('hal')
-        # Anga has the pattern CVC, where C is a consonant and V
-        # is a vowel.
-        eka_hal_madhya = a in hal and b == 'a' and c in hal
-        # Abhyasa and anga have the same initial letter. I'm not
-        # sure how to account for 8.4.54 in the normal way, so as
-        # a hack, I check for the consonants that 8.4.54 would
-        # modify.
-        _8_4_54 = anga.adi not in Sounds('Jaz')
-        anadeshadi = abhyasa.adi == anga.adi and _8_4_54
-
-        return eka_hal_madhya and anadeshadi
-    except (IndexError, ValueError):
+    if index >= len(state):
         return False
+    return ekahalmadhya_anadeshadi(state[index - 1].adi, state[index].value)
 
 
 @O.Operator.no_params
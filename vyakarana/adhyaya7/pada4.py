@@ -16,14 +16,17 @@ f = F.auto
 ac = Sounds('ac')
 shar = Sounds('Sar')
 khay = Sounds('Kay')
+hal = Sounds('hal')
+hal_r = Sounds('hal f')
 
 
 @O.Operator.no_params
 def hal_shesha(state, index, locus=None):
     cur = state[index]
+    value = cur.value
     first_hal = first_ac = ''
-    for i, L in enumerate(cur.value):
-        if i == 1 and cur.value[0] in shar and L in khay:
+    for i, L in enumerate(value):
+        if i == 1 and value[0] in shar and L in khay:
             first_hal = L
         if L in ac:
             first_ac = L
@@ -32,7 +35,7 @@ def hal_shesha(state, index, locus=None):
             first_hal = L
 
     new_value = first_hal + first_ac
-    if new_value != cur.value:
+    if new_value != value:
         return state.swap(index, cur.set_value(new_value))
     else:
         return state
@@ -40,8 +43,6 @@ def hal_shesha(state, index, locus=None):
 
 @F.AlFilter.no_params
 def dvihal(term):
-    hal = Sounds('hal')
-    hal_r = Sounds('hal f')
     return term.upadha in hal_r and term.antya in hal
 
 
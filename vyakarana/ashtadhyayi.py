@@ -65,7 +65,7 @@ class Ashtadhyayi(object):
                 continue
 
             # Only worthwhile rules
-            ra_states = list(ra.apply(state, ia))
+            ra_states = ra.apply(state, ia)
             if not ra_states:
                 continue
 
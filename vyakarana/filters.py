@@ -23,6 +23,8 @@ from terms import Upadesha
 
 FILTER_NAME_MAX_ARGS = 4
 DHATU_SET = set(DP.all_dhatu)
+AC = Sounds('ac')
+HAL = Sounds('hal')
 
 
 class Filter(object):
@@ -73,6 +75,12 @@ class Filter(object):
         #: - for an and/or/not filter, the original filters
         self.domain = self._make_domain(*args, **kw)
 
+        #: For an "and" or "or" filter, the filters that it combines.
+        #: Nested filters of the same kind are expanded in place, so
+        #: ``(f1 & f2) & f3`` tests `f1`, `f2`, and `f3` directly
+        #: instead of going through an extra layer of calls.
+        self.operands = kw.get('operands')
+
     def allows(self, state, index):
         return self.body(state, index)
 
@@ -160,18 +168,22 @@ class Filter(object):
         """Return the logical "AND" over all filters."""
         cls = Filter._select_class(filters)
         name = 'and(%s)' % ', '.join(f.name for f in filters)
-        body = cls._make_and_body(filters)
+        operands = Filter._flatten('and', filters)
+        body = cls._make_and_body(operands)
         domain = set(filters)
-        return cls(category='and', name=name, body=body, domain=domain)
+        return cls(category='and', name=name, body=body, domain=domain,
+                   operands=operands)
 
     @staticmethod
     def _or(*filters):
         """Return the logical "OR" over all filters."""
         cls = Filter._select_class(filters)
         name = 'or(%s)' % ', '.join(f.name for f in filters)
-        body = cls._make_or_body(filters)
+        operands = Filter._flatten('or', filters)
+        body = cls._make_or_body(operands)
         domain = set(filters)
-        return cls(category='or', name=name, body=body, domain=domain)
+        return cls(category='or', name=name, body=body, domain=domain,
+                   operands=operands)
 
     @staticmethod
     def _not(filt):
@@ -185,6 +197,21 @@ class Filter(object):
         domain = set([filt])
         return cls(category='not', name=name, body=body, domain=domain)
 
+    @staticmethod
+    def _flatten(category, filters):
+        """Expand any filters of the given category into their operands.
+
+        :param category: ``'and'`` or ``'or'``
+        :param filters: a list of filters
+        """
+        returned = []
+        for f in filters:
+            if f.category == category and f.operands is not None:
+                returned.extend(f.operands)
+            else:
+                returned.append(f)
+        return returned
+
     @staticmethod
     def _select_class(filters):
         """Return the lowest common ancestor of the given filters.
@@ -205,7 +232,7 @@ class Filter(object):
         :param filters:
         """
         def func(state, index):
-            return all(f(state, index) for f in filters)
+            return all(f.allows(state, index) for f in filters)
         return func
 
     @classmethod
@@ -218,7 +245,7 @@ class Filter(object):
         :param filters:
         """
         def func(state, index):
-            return any(f(state, index) for f in filters)
+            return any(f.allows(state, index) for f in filters)
         return func
 
     @classmethod
@@ -476,7 +503,7 @@ class lakshana(UpadeshaFilter):
     """Filter on a term's prior values."""
 
     def body(self, term):
-        return any(x in term.lakshana for x in self.domain)
+        return not term.lakshana.isdisjoint(self.domain)
 
 
 class part(TermFilter):
@@ -484,7 +511,7 @@ class part(TermFilter):
     """Filter on a term's augments."""
 
     def body(self, term):
-        return any(x in term.parts for x in self.domain)
+        return not term.parts.isdisjoint(self.domain)
 
 
 class raw(UpadeshaFilter):
@@ -500,7 +527,7 @@ class samjna(SamjnaFilter):
     """Filter on a term's designations."""
 
     def body(self, term):
-        return any(x in term.samjna for x in self.domain)
+        return not term.samjna.isdisjoint(self.domain)
 
 
 class upadha(AlFilter):
@@ -544,9 +571,8 @@ def allow_all(*args):
 @AlFilter.no_params
 def ekac(term):
     seen = False
-    ac = Sounds('ac')
     for L in term.value:
-        if L in ac:
+        if L in AC:
             if seen:
                 return False
             seen = True
@@ -556,17 +582,15 @@ def ekac(term):
 @AlFilter.no_params
 def samyoga(term):
     """Filter on whether a term ends with a conjunct."""
-    hal = Sounds('hal')
-    return term.antya in hal and term.upadha in hal
+    return term.antya in HAL and term.upadha in HAL
 
 
 @AlFilter.no_params
 def samyogadi(term):
     """Filter on whether a term begins with a conjunct."""
     value = term.value
-    hal = Sounds('hal')
     try:
-        return value[0] in hal and value[1] in hal
+        return value[0] in HAL and value[1] in HAL
     except IndexError:
         return False
 
@@ -575,9 +599,8 @@ def samyogadi(term):
 def samyogapurva(term):
     """Filter on whether a term's final sound follows a conjunct."""
     value = term.value
-    hal = Sounds('hal')
     try:
-        return value[-3] in hal and value[-2] in hal
+        return value[-3] in HAL and value[-2] in HAL
     except IndexError:
         return False
 
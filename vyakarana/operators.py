@@ -24,11 +24,19 @@ conflicts = [
     ('ti', 'tasya'),
 ]
 
+#: Letter mappings for the sound-changing operators below.
+DIRGHA = dict(zip('aiufx', 'AIUFX'))
+HRASVA = dict(zip('AIUFXeEoO', 'aiufxiiuu'))
+GUNA = dict(zip('iIuUfFxX', 'eeooaaaa'))
+VRDDHI = dict(zip('iIuUfFxX', 'EEOOAAAA'))
+
 
 class Operator(object):
 
     """A callable class that returns states."""
 
+    __slots__ = ['category', 'name', 'body', 'params']
+
     def __init__(self, *args, **kw):
         #: The operator type. For example, a substitution operator has
         #: category ``tasya``.
@@ -151,6 +159,8 @@ class DataOperator(Operator):
     `body` accepts and returns a single string.
     """
 
+    __slots__ = ()
+
     def apply(self, state, index, locus='value'):
         cur = state[index]
         _input = cur.value
@@ -213,65 +223,82 @@ def replace(target, result):
 
 @Operator.parameterized
 def tasya(sthani, adi=False):
-    def func(state, index, locus):
-        term = state[index]
-        term_value = term.get_at(locus)
-        new_value = None
-        add_part = False
+    # Which substitution applies depends only on `sthani`, so we select
+    # the case once here instead of re-testing it on every call.
+    add_part = False
+
+    # 1.1.54 ādeḥ parasya
+    if adi:
+        if hasattr(sthani, 'value'):
+            prefix = sthani.value
+        else:
+            prefix = sthani
 
-        # 1.1.54 ādeḥ parasya
-        if adi:
-            try:
-                new_value = sthani.value + term_value[1:]
-            except AttributeError:
-                new_value = sthani + term_value[1:]
-
-        elif isinstance(sthani, basestring):
-            # 1.1.52 alo 'ntyasya
-            # 1.1.55 anekālśit sarvasya
-            if len(sthani) <= 1:
-                new_value = term_value[:-1] + sthani
-            else:
-                new_value = sthani
-
-        elif not hasattr(sthani, 'value'):
-            # 1.1.50 sthāne 'ntaratamaḥ
+        def substitute(term, term_value):
+            return prefix + term_value[1:]
+
+    elif isinstance(sthani, basestring):
+        # 1.1.52 alo 'ntyasya
+        # 1.1.55 anekālśit sarvasya
+        if len(sthani) <= 1:
+            def substitute(term, term_value):
+                return term_value[:-1] + sthani
+        else:
+            def substitute(term, term_value):
+                return sthani
+
+    elif not hasattr(sthani, 'value'):
+        # 1.1.50 sthāne 'ntaratamaḥ
+        def substitute(term, term_value):
             last = Sound(term.antya).closest(sthani)
-            new_value = term_value[:-1] + last
+            return term_value[:-1] + last
+
+    # 1.1.47 mid aco 'ntyāt paraḥ
+    elif 'mit' in sthani.samjna:
+        ac = Sounds('ac')
+        add_part = True
 
-        # 1.1.47 mid aco 'ntyāt paraḥ
-        elif 'mit' in sthani.samjna:
-            ac = Sounds('ac')
+        def substitute(term, term_value):
             for i, L in enumerate(reversed(term_value)):
                 if L in ac:
                     break
-            new_value = term_value[:-i] + sthani.value + term_value[-i:]
-            add_part = True
+            return term_value[:-i] + sthani.value + term_value[-i:]
 
-        # 1.1.46 ādyantau ṭakitau
-        elif 'kit' in sthani.samjna:
-            new_value = term_value + sthani.value
-            add_part = True
-        elif 'wit' in sthani.samjna:
-            new_value = sthani.value + term_value
-            add_part = True
+    # 1.1.46 ādyantau ṭakitau
+    elif 'kit' in sthani.samjna:
+        add_part = True
 
-        # 1.1.52 alo 'ntyasya
-        # 1.1.53 ṅic ca
-        elif len(sthani.value) == 1 or 'Nit' in sthani.samjna:
-            new_value = term_value[:-1] + sthani.value
+        def substitute(term, term_value):
+            return term_value + sthani.value
+    elif 'wit' in sthani.samjna:
+        add_part = True
 
-        # 1.1.55 anekālśit sarvasya
-        elif 'S' in sthani.it or len(sthani.value) > 1:
-            new_value = sthani.value
+        def substitute(term, term_value):
+            return sthani.value + term_value
+
+    # 1.1.52 alo 'ntyasya
+    # 1.1.53 ṅic ca
+    elif len(sthani.value) == 1 or 'Nit' in sthani.samjna:
+        def substitute(term, term_value):
+            return term_value[:-1] + sthani.value
 
-        if new_value is not None:
-            new_term = term.set_at(locus, new_value)
-            if add_part:
-                new_term = new_term.add_part(sthani.raw)
-            return state.swap(index, new_term)
+    # 1.1.55 anekālśit sarvasya
+    elif 'Sit' in sthani.samjna or len(sthani.value) > 1:
+        def substitute(term, term_value):
+            return sthani.value
 
-        raise NotImplementedError(sthani)
+    else:
+        substitute = None
+
+    def func(state, index, locus):
+        if substitute is None:
+            raise NotImplementedError(sthani)
+
+        term = state[index]
+        new_term = term.set_at(locus, substitute(term, term.get_at(locus)))
+        if add_part:
+            new_term = new_term.add_part(sthani.raw)
+        return state.swap(index, new_term)
 
     return func
 
@@ -331,11 +358,10 @@ def yathasamkhya(targets, results):
 
 @DataOperator.no_params
 def dirgha(value):
-    converter = dict(zip('aiufx', 'AIUFX'))
     letters = list(value)
     for i, L in enumerate(letters):
-        if L in converter:
-            letters[i] = converter[L]
+        if L in DIRGHA:
+            letters[i] = DIRGHA[L]
             break
 
     return ''.join(letters)
@@ -344,9 +370,9 @@ def dirgha(value):
 @Operator.no_params
 def guna(state, index, locus=None):
     cur = state[index]
-    try:
+    if index + 1 < len(state):
         right = state[index + 1]
-    except (IndexError, TypeError):
+    else:
         right = None
 
     # 1.1.5 kGiti ca (na)
@@ -355,11 +381,10 @@ def guna(state, index, locus=None):
 
     # 1.1.2 adeG guNaH
     # 1.1.3 iko guNavRddhI
-    converter = dict(zip('iIuUfFxX', 'eeooaaaa'))
     letters = list(cur.value)
     for i, L in enumerate(letters):
-        if L in converter:
-            letters[i] = converter[L]
+        if L in GUNA:
+            letters[i] = GUNA[L]
             if L in 'fF':
                 letters[i] += 'r'
             break
@@ -370,11 +395,10 @@ def guna(state, index, locus=None):
 
 @DataOperator.no_params
 def hrasva(value):
-    converter = dict(zip('AIUFXeEoO', 'aiufxiiuu'))
     letters = list(value)
     for i, L in enumerate(letters):
-        if L in converter:
-            letters[i] = converter[L]
+        if L in HRASVA:
+            letters[i] = HRASVA[L]
             break
 
     return ''.join(letters)
@@ -409,9 +433,9 @@ def samprasarana(value):
 @Operator.no_params
 def vrddhi(state, index, locus=None):
     cur = state[index]
-    try:
+    if index + 1 < len(state):
         right = state[index + 1]
-    except (IndexError, TypeError):
+    else:
         right = None
 
     # 1.1.5 kGiti ca (na)
@@ -421,11 +445,10 @@ def vrddhi(state, index, locus=None):
 
     # 1.1.1 vRddhir Adaic
     # 1.1.3 iko guNavRddhI
-    converter = dict(zip('iIuUfFxX', 'EEOOAAAA'))
     letters = list(cur.value)
     for i, L in enumerate(letters):
-        if L in converter:
-            letters[i] = converter[L]
+        if L in VRDDHI:
+            letters[i] = VRDDHI[L]
             if L in 'fF':
                 letters[i] += 'r'
             break
@@ -437,11 +460,10 @@ def vrddhi(state, index, locus=None):
 @Operator.no_params
 def force_guna(state, index, locus=None):
     cur = state[index]
-    converter = dict(zip('iIuUfFxX', 'eeooaaaa'))
     letters = list(cur.value)
     for i, L in enumerate(letters):
-        if L in converter:
-            letters[i] = converter[L]
+        if L in GUNA:
+            letters[i] = GUNA[L]
             if L in 'fF':
                 letters[i] += 'r'
             break
@@ -72,6 +72,10 @@ class Rule(object):
         self.utsarga = []
         self.apavada = []
 
+        # `modifier` and `optional` never change after this point, so
+        # pick the matching version of `apply` just once.
+        self._apply = self._select_apply()
+
     def __repr__(self):
         return '<Rule(%s)>' % repr(self.name)
 
@@ -87,34 +91,54 @@ class Rule(object):
 
         return result.mark_rule(self, index)
 
+    def _mark_applied(self, state, index):
+        """Mark the rule on `state` and block all utsarga rules."""
+        new = state.mark_rule(self, index)
+        return new.swap(index, new[index].add_op(*self.utsarga))
+
+    def _apply_na(self, state, index):
+        # 'na' rule. Apply no operation, but block any general rules
+        # from applying.
+        returned = []
+        if self.optional:
+            returned.append(self._apply_option_declined(state, index))
+        returned.append(self._mark_applied(state, index))
+        return returned
+
+    def _apply_optional(self, state, index):
+        # Option declined. Mark the state but leave the rest alone.
+        declined = self._apply_option_declined(state, index)
+
+        # Option accepted. Apply the operator even if it changes nothing.
+        new = self.operator.apply(state, index + self.offset, self.locus)
+        return [declined, self._mark_applied(new, index)]
+
+    def _apply_mandatory(self, state, index):
+        # Apply the operator. We return the result only if the state is
+        # different; otherwise the system will loop.
+        new = self.operator.apply(state, index + self.offset, self.locus)
+        if new != state:
+            return [self._mark_applied(new, index)]
+        return []
+
+    def _select_apply(self):
+        if self.modifier is Na:
+            return self._apply_na
+        elif self.optional:
+            return self._apply_optional
+        else:
+            return self._apply_mandatory
+
     def apply(self, state, index):
-        """Apply this rule and yield the results.
+        """Apply this rule and return a list of the results.
+
+        A rule produces at most two states, so we return a list instead
+        of paying for a generator on every application.
 
         :param state: a state
         :param index: the index where the first filter is applied.
         """
-        if self.optional:
-            # Option declined. Mark the state but leave the rest alone.
-            yield self._apply_option_declined(state, index)
-
-        # 'na' rule. Apply no operation, but block any general rules
-        # from applying.
-        if self.modifier is Na:
-            new = state.mark_rule(self, index)
-            new = new.swap(index, new[index].add_op(*self.utsarga))
-            yield new
-            return
-
-        # Mandatory, or option accepted. Apply the operator and yield.
-        # Also, block all utsarga rules.
-        #
-        # We yield only if the state is different; otherwise the system
-        # will loop.
-        new = self.operator.apply(state, index + self.offset, self.locus)
-        if new != state or self.optional:
-            new = new.mark_rule(self, index)
-            new = new.swap(index, new[index].add_op(*self.utsarga))
-            yield new
+        return self._apply(state, index)
 
     def features(self):
         feature_set = set()
@@ -15,6 +15,16 @@ dirgha = O.dirgha.body
 iko_yan_aci = O.al_tasya('ik', 'yaR').body
 guna = convert(O.guna)
 vrddhi = convert(O.vrddhi)
+ayavayavah = dict(zip('eEoO', 'ay Ay av Av'.split()))
+
+AC = Sounds('ac')
+HAL = Sounds('hal')
+IK = Sounds('ik')
+IC = Sounds('ic')
+EC = Sounds('ec')
+AT_EN = Sounds('at eN')
+VY = Sounds('v y')
+VAL = Sounds('val')
 
 
 def apply(state):
@@ -25,9 +35,12 @@ def apply(state):
             continue
 
         x, y = cur.value, next.value
-        if x in Sounds('ac'):
-            cur.value, next.value = ac_sandhi(x, y)
-        elif x in Sounds('hal'):
+        if x in AC:
+            # Every rule of ac sandhi needs a following vowel, so skip
+            # the common case of a vowel followed by a consonant.
+            if y in AC:
+                cur.value, next.value = ac_sandhi(x, y)
+        elif x in HAL:
             cur.value, next.value = hal_sandhi(x, y)
 
     yield editor.join()
@@ -44,7 +57,7 @@ def ac_sandhi(x, y):
     """
 
     # 6.1.97 ato guNe
-    if x == 'a' and y in Sounds('at eN'):
+    if x == 'a' and y in AT_EN:
         x = ''
 
     # 6.1.101 akaH savarNe dIrghaH
@@ -53,20 +66,19 @@ def ac_sandhi(x, y):
         y = dirgha(y)
 
     # 6.1.77 iko yaN aci
-    elif x in Sounds('ik') and y in Sounds('ac'):
+    elif x in IK and y in AC:
         x = iko_yan_aci(x)
 
     # 6.1.78 eco 'yavAyAvaH
-    elif x in Sounds('ec') and y in Sounds('ac'):
-        converter = dict(zip('eEoO', 'ay Ay av Av'.split()))
-        x = converter[x]
+    elif x in EC and y in AC:
+        x = ayavayavah[x]
 
-    elif x in 'aA' and y in Sounds('ic'):
+    elif x in 'aA' and y in IC:
         x = ''
 
         # 6.1.87 Ad guNaH
         # 6.1.88 vRddhir eci
-        y = vrddhi(y) if y in Sounds('ec') else guna(y)
+        y = vrddhi(y) if y in EC else guna(y)
 
     return x, y
 
@@ -82,7 +94,7 @@ def hal_sandhi(x, y):
     """
 
     # 6.1.66 lopo vyor vali
-    if x in Sounds('v y') and y in Sounds('val'):
+    if x in VY and y in VAL:
         x = ''
 
     return x, y
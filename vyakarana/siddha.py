@@ -11,6 +11,28 @@ from sounds import Sounds, Sound, Pratyahara
 from terms import Upadesha
 from util import SoundEditor, SoundIndex
 
+#: Roots that take 'z' by 8.2.36.
+VRASCADI = frozenset(['vraSc', 'Brasj', 'sfj', 'mfj', 'yaj', 'rAj', 'BrAj'])
+
+#: Sound groups used by the tripAdI rules below.
+HAL = Sounds('hal')
+JHAL = Sounds('Jal')
+CU = Sounds('cu')
+KU = Sounds('ku')
+JHAZ = Sounds('Jaz')
+IN_KU = Sounds('iN ku')
+IN_SECOND = Pratyahara('iR', second_R=True)
+ATKUPVAN = Sounds('aw ku pu')
+STU = Sounds('s tu')
+SCU = Sounds('S cu')
+ZWU = Sounds('z wu')
+JHAS = Sounds('JaS')
+JAS = Sounds('jaS')
+CAR_JAS = Sounds('car jaS')
+KHAR = Sounds('Kar')
+CAR = Sounds('car')
+YAY = Sounds('yay')
+
 
 def asiddha_helper(state):
     """Chapter 8.2 of the Ashtadhyayi starts the 'asiddha' section of
@@ -38,29 +60,29 @@ def asiddha_helper(state):
         n2 = n.next
 
         w, x, y, z = (p.value, c.value, n.value, n2.value)
+        term = c.term
+        samjna = term.samjna
 
         # 8.2.29 skoH saMyogAdyor ante ca
         # TODO: pada end
-        if x in 'sk' and y in Sounds('hal') and z in Sounds('Jal'):
+        if x in 'sk' and y in HAL and z in JHAL:
             x = '_'
 
-        if y in Sounds('Jal'):
+        if y in JHAL:
             # 8.2.30 coH kuH
-            cu = Sounds('cu')
-            if x in cu and y in Sounds('Jal') and y not in cu:
-                x = Sound(x).closest(Sounds('ku'))
+            if x in CU and y in JHAL and y not in CU:
+                x = Sound(x).closest(KU)
 
             # 8.2.31 ho DhaH
             elif x == 'h':
                 x = 'Q'
 
             # 8.2.36 vrazca-bhrasja-sRja-mRja-yaja-rAja-bhrAjacCazAM SaH
-            roots = {'vraSc', 'Brasj', 'sfj', 'mfj', 'yaj', 'rAj', 'BrAj'}
-            if c.last and (c.term.value in roots or c.term.antya in 'SC'):
+            if c.last and (term.value in VRASCADI or term.antya in 'SC'):
                 x = 'z'
 
         # 8.2.40 (TODO: not dhA)
-        if w in Sounds('Jaz') and x in 'tT':
+        if w in JHAZ and x in 'tT':
             x = 'D'
         elif x == 'D' and y in 'tT':
             continue
@@ -78,22 +100,22 @@ def asiddha_helper(state):
         #     x = 'M'
 
         # 8.3.24 naz cApadAntasya jhali
-        elif x in 'mn' and y in Sounds('Jal'):
+        elif x in 'mn' and y in JHAL:
             x = 'M'
 
         # 8.3.59 AdezapratyayayoH
-        if w in Sounds('iN ku'):
-            if not c.last and x == 's' and (c.term.raw[0] == 'z'
-                                            or 'pratyaya' in c.term.samjna):
+        if w in IN_KU:
+            if not c.last and x == 's' and (term.raw[0] == 'z'
+                                            or 'pratyaya' in samjna):
                 x = 'z'
 
         # 8.3.78 iNaH SIdhvaMluGliTAM dho 'GgAt
         # 8.3.79 vibhASeTaH
         # TODO: SIdhvam, luG
         if (x == 'D'
-                and w in Pratyahara('iR', second_R=True)
+                and w in IN_SECOND
                 and c.first  # not triggered by iT
-                and 'li~w' in c.term.lakshana):
+                and 'li~w' in term.lakshana):
             x = 'Q'
 
         # 8.4.1 raSAbhyAM no NaH samAnapade
@@ -105,42 +127,39 @@ def asiddha_helper(state):
         elif x == 'n' and had_rs and p.term.value != 'kzuB':
             x = 'R'
             had_rs = False
-        elif x not in Sounds('aw ku pu'):
+        elif x not in ATKUPVAN:
             had_rs = False
 
-        stu = Sounds('s tu')
-        if x in stu:
+        if x in STU:
 
             # 8.4.40 stoH zcunA zcuH
             # 8.4.44 zAt (na)
-            scu = Sounds('S cu')
             if w == 'S':
                 pass
-            elif w in scu or y in scu:
-                x = Sound(x).closest(scu)
+            elif w in SCU or y in SCU:
+                x = Sound(x).closest(SCU)
 
             # 8.4.41 STunA STuH
-            zwu = Sounds('z wu')
-            if w in zwu or y in zwu:
-                x = Sound(x).closest(zwu)
+            if w in ZWU or y in ZWU:
+                x = Sound(x).closest(ZWU)
 
-        if x in Sounds('Jal'):
+        if x in JHAL:
             x_ = x
 
             # 8.4.53 jhalAM jaz jhazi
-            if y in Sounds('JaS'):
-                x = Sound(x_).closest(Sounds('jaS'))
+            if y in JHAS:
+                x = Sound(x_).closest(JAS)
 
             # 8.4.54 abhyAse car ca
-            if 'abhyasa' in c.term.samjna and c.first:
-                x = Sound(x_).closest(Sounds('car jaS'))
+            if 'abhyasa' in samjna and c.first:
+                x = Sound(x_).closest(CAR_JAS)
 
             # 8.4.55 khari ca
-            if y in Sounds('Kar'):
-                x = Sound(x_).closest(Sounds('car'))
+            if y in KHAR:
+                x = Sound(x_).closest(CAR)
 
         # 8.4.58 anusvArasya yayi parasavarNaH
-        if x == 'M' and y in Sounds('yay'):
+        if x == 'M' and y in YAY:
             x = Sound(x).closest(Sound(y).savarna_set)
 
         c.value = x if x != '_' else ''
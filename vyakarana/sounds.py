@@ -11,13 +11,16 @@
 
 def memoize(c):
     cache = {}
-    get_key = lambda a, kw: tuple(a) + (frozenset(kw.items()),)
 
     def memoized(*a, **kw):
-        key = get_key(a, kw)
-        if key not in cache:
-            cache[key] = c(*a, **kw)
-        return cache[key]
+        # Almost every call is positional, e.g. ``Sounds('hal')``, so
+        # avoid building a keyword key unless we need one.
+        key = a + (frozenset(kw.items()),) if kw else a
+        try:
+            return cache[key]
+        except KeyError:
+            value = cache[key] = c(*a, **kw)
+            return value
     return memoized
 
 
@@ -151,7 +154,15 @@ class Sound(object):
 
             1.1.9  tulyAsyaprayatnaM savarNam
             1.1.10 nAjjhalau
+
+        Since :class:`Sound` is memoized, the result is computed once
+        per sound and reused by :meth:`savarna` and :meth:`asavarna`.
         """
+        try:
+            return self._savarna_set
+        except AttributeError:
+            pass
+
         s = self.value
         a = p = None
 
@@ -167,10 +178,12 @@ class Sound(object):
             p = a
 
         results = a.intersection(p)
-        is_ac = s in Pratyahara('ac')
+        ac = Pratyahara('ac')
+        is_ac = s in ac
 
         # 1.1.10 na ac-halau
-        return set([x for x in results if (x in Pratyahara('ac')) == is_ac])
+        self._savarna_set = frozenset(x for x in results if (x in ac) == is_ac)
+        return self._savarna_set
 
 
 class SoundCollection(object):
@@ -209,7 +222,7 @@ class Sounds(SoundCollection):
         else:
             items = phrase
 
-        v = self.values = set()
+        v = set()
         for item in items:
 
             first, last = (item[0], item[-1])
@@ -228,6 +241,8 @@ class Sounds(SoundCollection):
             else:
                 v.update(Pratyahara(item).values)
 
+        self.values = frozenset(v)
+
 
 @memoize
 class Pratyahara(SoundCollection):
@@ -266,16 +281,18 @@ class Pratyahara(SoundCollection):
         found_first = False
 
         self.name = name
-        self.values = set([first])
+        values = set([first])
 
         for items, it in self.rules:
             if found_first:
-                self.values.update(items)
+                values.update(items)
             elif first in items:
-                self.values.update(items.partition(first)[-1])
+                values.update(items.partition(first)[-1])
                 found_first = True
             if found_first and it == limit:
                 if second_R:
                     second_R = False
                 else:
                     break
+
+        self.values = frozenset(values)
@@ -116,20 +116,16 @@ class Upadesha(object):
         return Upadesha(*a, **kw).add_samjna('anga', 'dhatu')
 
     @property
-    def adi(self, locus='value'):
+    def adi(self):
         """The term's first sound, or ``None`` if there isn't one."""
-        try:
-            return getattr(self.data, locus)[0]
-        except IndexError:
-            return None
+        value = self.data.value
+        return value[0] if value else None
 
     @property
-    def antya(self, locus='value'):
+    def antya(self):
         """The term's last sound, or ``None`` if there isn't one."""
-        try:
-            return getattr(self.data, locus)[-1]
-        except IndexError:
-            return None
+        value = self.data.value
+        return value[-1] if value else None
 
     @property
     def asiddha(self):
@@ -152,12 +148,10 @@ class Upadesha(object):
         return self.data.raw
 
     @property
-    def upadha(self, locus='value'):
+    def upadha(self):
         """The term's penultimate sound, or ``None`` if there isn't one."""
-        try:
-            return getattr(self.data, locus)[-2]
-        except IndexError:
-            return None
+        value = self.data.value
+        return value[-2] if len(value) > 1 else None
 
     @property
     def value(self):
@@ -265,11 +259,18 @@ class Upadesha(object):
         return self.copy(lakshana=self.lakshana.union(names))
 
     def add_op(self, *names):
-        """
+        """Return a copy of this term with the given ops added.
+
+        Filters never look at `ops`, so the new term can share this
+        term's filter cache. Since every rule application marks its
+        term with an op, this keeps filter results from being thrown
+        away after each step of a derivation.
 
         :param names: the ops to add
         """
-        return self.copy(ops=self.ops.union(names))
+        term = self.copy(ops=self.ops.union(names))
+        term._filter_cache = self._filter_cache
+        return term
 
     def add_part(self, *names):
         """
@@ -290,7 +291,7 @@ class Upadesha(object):
 
         :param names:
         """
-        return any(a in self.samjna for a in names)
+        return not self.samjna.isdisjoint(names)
 
     def get_at(self, locus):
         """
@@ -60,6 +60,8 @@ class RuleTree(object):
         # HACK
         if ranker is not None:
             self.ranked_rules = sorted(rules, key=ranker, reverse=True)
+            #: Maps a rule to its position in `self.ranked_rules`.
+            self.rank = {r: i for i, r in enumerate(self.ranked_rules)}
             apavadas = find_apavada_rules(rules)
             for rule, values in apavadas.iteritems():
                 rule.apavada = values
@@ -109,13 +111,17 @@ class RuleTree(object):
 
         :param state: the current state
         """
-        state_indices = range(len(state))
-        candidates = [self.select(state, i) for i in state_indices]
-
-        for i, ra in enumerate(self.ranked_rules):
-            for ia in state_indices:
-                if ra in candidates[ia]:
-                    yield ra, ia
+        # Order the selected pairs by rank, then by index. This gives
+        # the same order as testing every ranked rule against every
+        # index, but touches only the rules that were selected.
+        rank = self.rank
+        pairs = []
+        for ia in range(len(state)):
+            pairs.extend((rank[ra], ia, ra) for ra in self.select(state, ia))
+        pairs.sort()
+
+        for _, ia, ra in pairs:
+            yield ra, ia
 
     def pprint(self, depth=0):
         """Pretty-print the tree."""
@@ -133,11 +139,11 @@ class RuleTree(object):
         :param index: the current index
         """
         selection = set(self.rules)
+        update = selection.update
 
-        for feature, tree in self.features.iteritems():
-            filt, i = feature
+        for (filt, i), tree in self.features.iteritems():
             j = index + i
             if j >= 0 and filt.allows(state, j):
-                selection.update(tree.select(state, index))
+                update(tree.select(state, index))
 
         return selection